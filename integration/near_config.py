@@ -15,18 +15,31 @@ Environment variables:
     NEAR_CASCADE_EVAL_MODEL          - Primary evaluation model
     NEAR_CASCADE_EVAL_FALLBACK       - Fallback evaluation model
     NEAR_CASCADE_EVAL_MAX_TOKENS     - Max tokens for evaluation (default 2000)
+    NEAR_CASCADE_HEDGE_DELAY         - Seconds before racing the fallback against a
+                                       slow primary (async calls; unset = off)
 
     NEAR_CONTRACT_ID                 - Assessment attestation contract address
     NEAR_NETWORK                     - Network to use (testnet/mainnet)
     NEAR_PREFER_TEE                  - Prefer TEE-protected models (true/false)
+
+Boolean variables accept true/1/yes/on/t in any case; anything else is false.
 """
 
 import os
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Accepted (case-insensitive) spellings of a true boolean env var
+_TRUTHY = frozenset({"true", "1", "yes", "on", "t"})
+
+
+def _envflag(key: str, default: bool) -> bool:
+    """Read a boolean environment variable, falling back to default if unset."""
+    value = os.environ.get(key)
+    return value.lower() in _TRUTHY if value is not None else default
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CascadeLayerConfig:
     """Configuration for a single cascade layer."""
     primary: str
@@ -35,7 +48,7 @@ class CascadeLayerConfig:
     max_tokens: int = 500
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CascadeConfig:
     """Configuration for the three-layer model cascade."""
     chat: CascadeLayerConfig = field(default_factory=lambda: CascadeLayerConfig(
@@ -57,9 +70,12 @@ class CascadeConfig:
         max_tokens=2000,
     ))
     middleware_enabled: bool = True
+    # Async calls start the fallback if the primary hasn't answered after
+    # this many seconds and keep whichever finishes first (None = off)
+    hedge_delay: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NearConfig:
     """Configuration for NEAR Protocol integration."""
 
@@ -100,17 +116,18 @@ class NearConfig:
                 temperature=0.3,
                 max_tokens=int(os.getenv("NEAR_CASCADE_EVAL_MAX_TOKENS", "2000")),
             ),
-            middleware_enabled=os.getenv("NEAR_CASCADE_MIDDLEWARE_ENABLED", "true").lower() == "true",
+            middleware_enabled=_envflag("NEAR_CASCADE_MIDDLEWARE_ENABLED", True),
+            hedge_delay=float(hedge) if (hedge := os.getenv("NEAR_CASCADE_HEDGE_DELAY")) else None,
         )
 
         return cls(
             ai_api_key=os.getenv("NEAR_AI_API_KEY", ""),
-            ai_enabled=os.getenv("NEAR_AI_ENABLED", "false").lower() == "true",
+            ai_enabled=_envflag("NEAR_AI_ENABLED", False),
             ai_timeout=float(os.getenv("NEAR_AI_TIMEOUT", "30.0")),
             cascade=cascade,
             contract_id=os.getenv("NEAR_CONTRACT_ID", ""),
             network=os.getenv("NEAR_NETWORK", "testnet"),
-            prefer_tee=os.getenv("NEAR_PREFER_TEE", "true").lower() == "true",
+            prefer_tee=_envflag("NEAR_PREFER_TEE", True),
         )
 
     @property
@@ -135,6 +152,7 @@ NEAR_CASCADE_MIDDLEWARE_ENABLED=true
 NEAR_CASCADE_EVAL_MODEL=zai-org/GLM-4.7
 NEAR_CASCADE_EVAL_FALLBACK=openai/gpt-oss-120b
 NEAR_CASCADE_EVAL_MAX_TOKENS=2000
+# NEAR_CASCADE_HEDGE_DELAY=2.0
 
 # Contract (testnet for demo, mainnet for production)
 # Testnet: NEAR_CONTRACT_ID=paice-demo.testnet
@@ -10,15 +10,33 @@ Provides three capabilities:
 Usage:
     from near_service import NearAIClient, AttestationService, CascadeController
 
-    # Direct inference
-    client = NearAIClient(api_key="sk-...")
-    response = client.chat("openai/gpt-oss-120b", messages)
+    # Direct inference (reuse one client; it holds the connection pool)
+    with NearAIClient(api_key="sk-...") as client:
+        response = client.chat("openai/gpt-oss-120b", messages)
+
+        # Cascade (chat -> middleware -> eval) over the same client
+        cascade = CascadeController(client, config)
+        chat_result = cascade.chat(messages)
+        mw_result = cascade.middleware_check(ai_response)
+        eval_result = cascade.evaluate(messages)
+
+        # From sync code, run_all() overlaps the layers and closes the
+        # async pool it used
+        chat_result, mw_result, eval_result = cascade.run_all(
+            messages, ai_response, exchange_count
+        )
+
+    # Async: use "async with" so the async pool is closed on its own loop
+    async with NearAIClient(api_key="sk-...") as client:
+        cascade = CascadeController(client, config)
+        chat_result, mw_result, eval_result = await cascade.arun_all(
+            messages, ai_response, exchange_count
+        )
 
-    # Cascade (chat -> middleware -> eval)
-    cascade = CascadeController(client, config)
-    chat_result = cascade.chat(messages)
-    mw_result = cascade.middleware_check(ai_response)
-    eval_result = cascade.evaluate(messages)
+        # Async turn loop: each reply's middleware check runs in the
+        # background while the next turn's chat request is in flight
+        reply = await cascade.achat_turn(messages, exchange_count)
+        verdict = cascade.last_verdict  # previous reply's check
 
     # Attestation (testnet for demo, mainnet for production)
     attestation = AttestationService(contract_id="paice.near", network="mainnet")
@@ -26,22 +44,166 @@ Usage:
     verified = attestation.verify(session_id)
 """
 
+import asyncio
+import base64
+import bisect
+import functools
 import hashlib
+import importlib.util
 import json
 import logging
+import math
+import random
+import sys
+import threading
 import time
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from enum import IntEnum
+from json.encoder import encode_basestring_ascii
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Dict, Generator, List, Optional, Sequence, Tuple
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is always correct
+    orjson = None
+
+try:
+    import blake3
+except ImportError:  # optional speedup for cache keys; blake2b is the fallback
+    blake3 = None
+
 logger = logging.getLogger(__name__)
 
+# Parses bytes directly (no str decode step) when orjson is installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]").
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _cache_key_hash(data: bytes) -> str:
+    """
+    128-bit digest for cache keys (blake3 if installed, else blake2b).
+
+    Only for lookups; attestation hashes must stay SHA-256.
+    """
+    if blake3 is not None:
+        return blake3.blake3(data).hexdigest(length=16)
+    return hashlib.blake2b(data, digest_size=16, usedforsecurity=False).hexdigest()
+
 
 # =========================================================
 # NEAR AI Cloud - Private Inference
 # =========================================================
 
+# TEE-protected ("Private") models (verified as of Feb 2026)
+TEE_MODELS = frozenset({
+    "deepseek-ai/DeepSeek-V3.1",
+    "openai/gpt-oss-120b",
+    "Qwen/Qwen3-30B-A3B-Instruct-2507",
+    "zai-org/GLM-4.7",
+})
+
+# Anonymised models (proxied, not TEE-protected)
+ANONYMISED_MODELS = frozenset({
+    "anthropic/claude-opus-4-6",
+    "anthropic/claude-sonnet-4-5",
+    "openai/gpt-5.2",
+    "google/gemini-3-pro",
+})
+
+# All available models with pricing (per million tokens); read-only.
+# IDs are interned so lookups with interned IDs compare by identity.
+AVAILABLE_MODELS = MappingProxyType({
+    sys.intern(model): MappingProxyType(info) for model, info in {
+        "deepseek-ai/DeepSeek-V3.1": {"input": 1.05, "output": 3.10, "ctx": 128_000, "tee": True},
+        "openai/gpt-oss-120b": {"input": 0.15, "output": 0.55, "ctx": 131_000, "tee": True},
+        "Qwen/Qwen3-30B-A3B-Instruct-2507": {"input": 0.15, "output": 0.55, "ctx": 262_144, "tee": True},
+        "zai-org/GLM-4.7": {"input": 0.85, "output": 3.30, "ctx": 131_072, "tee": True},
+        "anthropic/claude-opus-4-6": {"input": 5.00, "output": 25.00, "ctx": 200_000, "tee": False},
+        "anthropic/claude-sonnet-4-5": {"input": 3.00, "output": 15.50, "ctx": 200_000, "tee": False},
+        "openai/gpt-5.2": {"input": 1.80, "output": 15.50, "ctx": 400_000, "tee": False},
+        "google/gemini-3-pro": {"input": 1.25, "output": 15.00, "ctx": 1_000_000, "tee": False},
+    }.items()
+})
+
+# Per-token (input, output) prices, and the fallback for unlisted models
+_COST_COEFFS = MappingProxyType({
+    model: (info["input"] * 1e-6, info["output"] * 1e-6)
+    for model, info in AVAILABLE_MODELS.items()
+})
+_DEFAULT_COST_COEFFS = (1.0e-6, 3.0e-6)
+
+# Display names without the provider prefix ("zai-org/GLM-4.7" -> "GLM-4.7")
+_SHORT_NAME = MappingProxyType({m: m.rsplit("/", 1)[-1] for m in AVAILABLE_MODELS})
+
+
+def _short(model: str) -> str:
+    """Short display name of a model ID."""
+    return _SHORT_NAME.get(model) or model.rsplit("/", 1)[-1]
+
+
+# The TEE set and the per-model "tee" flags must never drift apart
+assert TEE_MODELS == frozenset(m for m, info in AVAILABLE_MODELS.items() if info["tee"])
+assert ANONYMISED_MODELS == frozenset(m for m, info in AVAILABLE_MODELS.items() if not info["tee"])
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without sending a request while a model's circuit breaker is open."""
+
+
+class EmptyContentError(ValueError):
+    """Raised when a model returns no content (e.g. reasoning used every token)."""
+
+
+class FallbackFailedError(RuntimeError):
+    """Raised by chat() when a model returned no content and its fallback failed too."""
+
+    def __init__(self, model: str, fallback: str, empty_error: Exception, fallback_error: Exception):
+        super().__init__(
+            f"Model {model} returned empty content; fallback {fallback} failed: {fallback_error}"
+        )
+        self.empty_error = empty_error
+        self.fallback_error = fallback_error
+
+
+class _RateLimiter:
+    """
+    Token bucket allowing rpm requests per minute, in bursts of up to
+    one second's worth. The asyncio.Lock is recreated if the event loop
+    changes, so one limiter can serve successive asyncio.run() calls.
+    """
+
+    def __init__(self, rpm: float):
+        self.rate = rpm / 60.0
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock, self._loop = asyncio.Lock(), loop
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
 @dataclass
 class NearAIResponse:
     """Response from NEAR AI Cloud inference."""
@@ -50,6 +212,54 @@ class NearAIResponse:
     input_tokens: int
     output_tokens: int
     finish_reason: str
+    used_fallback: bool = False  # answered by chat()'s empty-content fallback
+
+
+class _StreamAccumulator:
+    """Collects the deltas, usage and finish reason of a streamed completion."""
+
+    __slots__ = ("model", "parts", "usage", "finish_reason")
+
+    def __init__(self, model: str):
+        self.model = model
+        self.parts: List[str] = []
+        self.usage: Dict[str, int] = {}
+        self.finish_reason = "unknown"
+
+    def feed(self, line: str) -> Optional[str]:
+        """Parse one SSE line; return its content delta, if any."""
+        if not line.startswith("data:"):
+            return None
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            return None
+        chunk = _json_loads(payload)
+        # With include_usage, the final chunk carries usage and no choices
+        self.usage = chunk.get("usage") or self.usage
+        self.model = chunk.get("model") or self.model
+        choices = chunk.get("choices")
+        if not choices:
+            return None
+        self.finish_reason = choices[0].get("finish_reason") or self.finish_reason
+        delta = (choices[0].get("delta") or {}).get("content")
+        if delta:
+            self.parts.append(delta)
+        return delta or None
+
+    def response(self, model: str) -> NearAIResponse:
+        """Assemble the full response; raise if the stream had no content."""
+        if not self.parts:
+            raise EmptyContentError(
+                f"Model {model} returned empty content. "
+                f"Increase max_tokens or use a different model."
+            )
+        return NearAIResponse(
+            content="".join(self.parts),
+            model=self.model,
+            input_tokens=self.usage.get("prompt_tokens", 0),
+            output_tokens=self.usage.get("completion_tokens", 0),
+            finish_reason=self.finish_reason,
+        )
 
 
 class NearAIClient:
@@ -60,87 +270,126 @@ class NearAIClient:
     enclaves on NVIDIA H100/H200 hardware. Conversations are
     processed in hardware-secured memory that is inaccessible
     to the cloud provider, NEAR, or anyone else.
+
+    The client keeps a pooled HTTP/2 connection open to NEAR AI Cloud,
+    so create one instance per process and share it (e.g. across
+    CascadeController instances) rather than one per request. Use it
+    as a context manager or call close() when done.
     """
 
     BASE_URL = "https://cloud-api.near.ai/v1"
 
-    # TEE-protected ("Private") models (verified as of Feb 2026)
-    TEE_MODELS = {
-        "deepseek-ai/DeepSeek-V3.1",
-        "openai/gpt-oss-120b",
-        "Qwen/Qwen3-30B-A3B-Instruct-2507",
-        "zai-org/GLM-4.7",
-    }
-
-    # Anonymised models (proxied, not TEE-protected)
-    ANONYMISED_MODELS = {
-        "anthropic/claude-opus-4-6",
-        "anthropic/claude-sonnet-4-5",
-        "openai/gpt-5.2",
-        "google/gemini-3-pro",
-    }
-
-    # All available models with pricing (per million tokens)
-    AVAILABLE_MODELS = {
-        "deepseek-ai/DeepSeek-V3.1": {"input": 1.05, "output": 3.10, "ctx": 128_000, "tee": True},
-        "openai/gpt-oss-120b": {"input": 0.15, "output": 0.55, "ctx": 131_000, "tee": True},
-        "Qwen/Qwen3-30B-A3B-Instruct-2507": {"input": 0.15, "output": 0.55, "ctx": 262_144, "tee": True},
-        "zai-org/GLM-4.7": {"input": 0.85, "output": 3.30, "ctx": 131_072, "tee": True},
-        "anthropic/claude-opus-4-6": {"input": 5.00, "output": 25.00, "ctx": 200_000, "tee": False},
-        "anthropic/claude-sonnet-4-5": {"input": 3.00, "output": 15.50, "ctx": 200_000, "tee": False},
-        "openai/gpt-5.2": {"input": 1.80, "output": 15.50, "ctx": 400_000, "tee": False},
-        "google/gemini-3-pro": {"input": 1.25, "output": 15.00, "ctx": 1_000_000, "tee": False},
-    }
+    TEE_MODELS = TEE_MODELS
+    ANONYMISED_MODELS = ANONYMISED_MODELS
+    AVAILABLE_MODELS = AVAILABLE_MODELS
+
+    # Transient statuses retried with exponential backoff + jitter
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    MAX_ATTEMPTS = 3
+    # Longest server-requested Retry-After honoured before retrying
+    RETRY_AFTER_CAP = 8.0
+
+    # Circuit breaker: more than BREAKER_THRESHOLD consecutive 5xx for a
+    # model within BREAKER_WINDOW seconds fails that model fast for
+    # BREAKER_COOLDOWN seconds, so the cascade goes straight to fallback.
+    # Shared by all clients: model -> (failures, first_failure_at, open_until)
+    BREAKER_THRESHOLD = 5
+    BREAKER_WINDOW = 30.0
+    BREAKER_COOLDOWN = 60.0
+    _breakers: Dict[str, Tuple[int, float, float]] = {}
+
+    # Connection pool shared by all requests from this client
+    POOL_LIMITS = httpx.Limits(
+        max_connections=64,
+        max_keepalive_connections=32,
+        keepalive_expiry=60.0,
+    )
+    # Async pool: concurrent calls multiplex over HTTP/2 when h2 is present
+    ASYNC_POOL_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=50,
+        keepalive_expiry=60.0,
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30.0,
+        models_ttl: float = 600.0,
+        max_concurrency: int = 50,
+        rpm: Optional[float] = None,
+    ):
+        """
+        Initialize the NEAR AI Cloud client.
 
-    def __init__(self, api_key: str, timeout: float = 30.0):
+        Args:
+            api_key: NEAR AI Cloud API key
+            timeout: Request timeout in seconds
+            models_ttl: Seconds to cache the list_models() catalog
+            max_concurrency: Default cap on requests in flight for
+                             achat_batch()/chat_many()
+            rpm: Requests-per-minute limit for achat_batch()/chat_many()
+                 (None = unlimited)
+        """
         self.api_key = api_key
-        self.client = httpx.Client(
-            base_url=self.BASE_URL,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=timeout,
-        )
+        self.timeout = timeout
+        self.models_ttl = models_ttl
+        self.max_concurrency = max_concurrency
+        self._limiter = _RateLimiter(rpm) if rpm else None
+        self._models_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self._sclient: Optional[httpx.Client] = None
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
 
-    def chat(
+        # is_tee_protected(model) -> bool: check if a model runs inside a
+        # TEE enclave. Bound frozenset lookup, so each call skips a Python frame
+        self.is_tee_protected = self.TEE_MODELS.__contains__
+
+    def _request_body(
         self,
         model: str,
         messages: List[Dict[str, str]],
-        temperature: float = 0.7,
-        max_tokens: int = 1024,
-    ) -> NearAIResponse:
-        """
-        Send a chat completion request via NEAR AI Cloud.
-
-        Args:
-            model: Model ID (e.g., "openai/gpt-oss-120b")
-            messages: List of message dicts with 'role' and 'content'
-            temperature: Sampling temperature (0.0-2.0)
-            max_tokens: Maximum tokens in response
-
-        Returns:
-            NearAIResponse with content and usage metadata
-        """
-        is_tee = model in self.TEE_MODELS
+        temperature: float,
+        max_tokens: int,
+        stop: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build the chat completion request body (and log the request)."""
+        is_tee = self.is_tee_protected(model)
         logger.info(
             f"NEAR AI Cloud request: model={model}, "
             f"tee={'yes' if is_tee else 'no'}, "
             f"messages={len(messages)}"
         )
+        body = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if stop:
+            body["stop"] = stop
+        return body
 
-        resp = self.client.post(
-            "/chat/completions",
-            json={
-                "model": model,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    def _stream_body(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> Dict[str, Any]:
+        """Request body for a streamed completion (usage sent in the last chunk)."""
+        body = self._request_body(model, messages, temperature, max_tokens)
+        body["stream"] = True
+        body["stream_options"] = {"include_usage": True}
+        return body
 
+    @staticmethod
+    def _parse_response(model: str, data: Dict[str, Any]) -> NearAIResponse:
+        """Convert a chat completion response body to a NearAIResponse."""
         choice = data["choices"][0]
         usage = data.get("usage", {})
         content = choice["message"].get("content")
@@ -148,7 +397,7 @@ class NearAIClient:
         # Handle reasoning models (GLM 4.7) that may exhaust tokens on thinking
         if not content:
             reasoning = choice["message"].get("reasoning_content", "")
-            raise ValueError(
+            raise EmptyContentError(
                 f"Model {model} returned empty content "
                 f"(reasoning tokens: {len(reasoning.split())} words). "
                 f"Increase max_tokens or use a different model."
@@ -162,24 +411,564 @@ class NearAIClient:
             finish_reason=choice.get("finish_reason", "unknown"),
         )
 
-    def is_tee_protected(self, model: str) -> bool:
-        """Check if a model runs inside a TEE enclave."""
-        return model in self.TEE_MODELS
+    def _check_breaker(self, model: str):
+        """Raise CircuitOpenError if the model's breaker is open."""
+        state = self._breakers.get(model)
+        if state is not None and state[2] > time.monotonic():
+            raise CircuitOpenError(
+                f"Model {model} circuit open after repeated 5xx errors; "
+                f"retry in {state[2] - time.monotonic():.0f}s"
+            )
+
+    def _record_status(self, model: str, status_code: int):
+        """Track consecutive 5xx responses per model, opening the breaker if needed."""
+        if status_code < 500:
+            self._breakers.pop(model, None)
+            return
+
+        now = time.monotonic()
+        failures, first_at, _ = self._breakers.get(model, (0, now, 0.0))
+        if now - first_at > self.BREAKER_WINDOW:
+            failures, first_at = 0, now
+        failures += 1
+        open_until = now + self.BREAKER_COOLDOWN if failures > self.BREAKER_THRESHOLD else 0.0
+        if open_until:
+            logger.warning(f"Circuit open for {model} ({failures} consecutive 5xx errors)")
+        self._breakers[model] = (failures, first_at, open_until)
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Seconds to wait before retry number attempt + 1."""
+        return (2 ** attempt) * 0.2 + random.random() * 0.1
+
+    def _retry_delay(self, attempt: int, resp: httpx.Response) -> float:
+        """Retry-After in seconds (capped at RETRY_AFTER_CAP) if sent, else _backoff()."""
+        retry_after = resp.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.RETRY_AFTER_CAP)
+            except ValueError:
+                pass  # HTTP-date form: fall back to our own schedule
+        return self._backoff(attempt)
+
+    def _retry_plan(
+        self,
+        attempt: int,
+        resp: httpx.Response,
+        budget_end: Optional[float],
+    ) -> Optional[Tuple[float, Any]]:
+        """
+        (delay, timeout) for retrying a transient error, or None to give up.
+
+        A retry is only made if its delay ends before budget_end (the
+        caller's timeout, measured from the first attempt); its HTTP
+        timeout then shrinks to the budget that is left.
+        """
+        if resp.status_code not in self.RETRY_STATUSES or attempt >= self.MAX_ATTEMPTS - 1:
+            return None
+        delay = self._retry_delay(attempt, resp)
+        if budget_end is None:
+            return delay, httpx.USE_CLIENT_DEFAULT
+        left = budget_end - time.monotonic() - delay
+        if left <= 0:
+            logger.warning(f"NEAR AI Cloud {resp.status_code}: no time left to retry")
+            return None
+        return delay, left
+
+    @staticmethod
+    def _time_left(end: Optional[float]) -> Optional[float]:
+        """Seconds left before a monotonic end time; raises TimeoutError once it has passed."""
+        if end is None:
+            return None
+        left = end - time.monotonic()
+        if left <= 0:
+            raise TimeoutError("Request timeout used up; no time left for another call")
+        return left
+
+    def _post_completion(self, model: str, body: Dict[str, Any], timeout: Optional[float]) -> httpx.Response:
+        """POST a completion, retrying transient errors within timeout; raises on failure."""
+        budget_end = None if timeout is None else time.monotonic() + timeout
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        for attempt in range(self.MAX_ATTEMPTS):
+            self._check_breaker(model)
+            resp = self.client.post("/chat/completions", json=body, timeout=request_timeout)
+            self._record_status(model, resp.status_code)
+            plan = self._retry_plan(attempt, resp, budget_end)
+            if plan is not None:
+                logger.warning(f"NEAR AI Cloud {resp.status_code} for {model}; retrying")
+                delay, request_timeout = plan
+                time.sleep(delay)
+                continue
+            resp.raise_for_status()
+            return resp
+
+    async def _apost_completion(
+        self, model: str, body: Dict[str, Any], timeout: Optional[float]
+    ) -> httpx.Response:
+        """Async version of _post_completion()."""
+        budget_end = None if timeout is None else time.monotonic() + timeout
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        for attempt in range(self.MAX_ATTEMPTS):
+            self._check_breaker(model)
+            resp = await self._async_client().post(
+                "/chat/completions", json=body, timeout=request_timeout
+            )
+            self._record_status(model, resp.status_code)
+            plan = self._retry_plan(attempt, resp, budget_end)
+            if plan is not None:
+                logger.warning(f"NEAR AI Cloud {resp.status_code} for {model}; retrying")
+                delay, request_timeout = plan
+                await asyncio.sleep(delay)
+                continue
+            resp.raise_for_status()
+            return resp
+
+    def chat(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        timeout: Optional[float] = None,
+        fallback: Optional[str] = None,
+        stop: Optional[List[str]] = None,
+    ) -> NearAIResponse:
+        """
+        Send a chat completion request via NEAR AI Cloud.
+
+        Args:
+            model: Model ID (e.g., "openai/gpt-oss-120b")
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum tokens in response
+            timeout: Per-request timeout in seconds (default: client timeout);
+                     a fallback call only gets what the primary left of it
+            fallback: Model to retry with (once, with max_tokens doubled) if
+                      the model returns empty content; the response then
+                      has used_fallback=True, and a failure of that retry
+                      raises FallbackFailedError
+            stop: Stop sequences; generation ends before the first match
+
+        Transient errors (429/502/503/504) are retried up to
+        MAX_ATTEMPTS times with jittered exponential backoff, or after
+        the server's Retry-After (capped at RETRY_AFTER_CAP seconds). With
+        an explicit timeout, retries must fit inside it: a wait that
+        would overrun it raises the HTTP error instead.
+
+        Returns:
+            NearAIResponse with content and usage metadata
+
+        Raises:
+            CircuitOpenError: if the model is failing fast after repeated 5xx
+        """
+        call_end = None if timeout is None else time.monotonic() + timeout
+        body = self._request_body(model, messages, temperature, max_tokens, stop)
+        resp = self._post_completion(model, body, timeout)
+        try:
+            return self._parse_response(model, _json_loads(resp.content))
+        except EmptyContentError as err:
+            if fallback is None:
+                raise
+            logger.warning(f"{err} Retrying with {fallback}")
+            try:
+                response = self.chat(
+                    fallback,
+                    messages,
+                    temperature,
+                    max_tokens * 2,
+                    self._time_left(call_end),
+                    stop=stop,
+                )
+            except Exception as fallback_err:
+                raise FallbackFailedError(model, fallback, err, fallback_err) from fallback_err
+            response.used_fallback = True
+            return response
+
+    def chat_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        timeout: Optional[float] = None,
+    ) -> Generator[str, None, NearAIResponse]:
+        """
+        Stream a chat completion, yielding content deltas as they arrive.
+
+        Same arguments as chat(). Consumers can start on the reply
+        before the model finishes instead of waiting for finish_reason.
+        The generator's return value (e.g. via ``yield from``) is the
+        complete NearAIResponse, token usage included.
+
+        Raises:
+            ValueError: if the stream ends without any content (e.g. a
+                        reasoning model spent max_tokens on thinking)
+        """
+        body = self._stream_body(model, messages, temperature, max_tokens)
+        acc = _StreamAccumulator(model)
+        with self.client.stream(
+            "POST",
+            "/chat/completions",
+            json=body,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                delta = acc.feed(line)
+                if delta is not None:
+                    yield delta
+
+        return acc.response(model)
+
+    async def achat_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async version of chat_stream().
+
+        Async generators can't return a value, so only the content
+        deltas are yielded; use chat_stream() or achat() when token
+        usage is needed.
+        """
+        body = self._stream_body(model, messages, temperature, max_tokens)
+        acc = _StreamAccumulator(model)
+        async with self._async_client().stream(
+            "POST",
+            "/chat/completions",
+            json=body,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                delta = acc.feed(line)
+                if delta is not None:
+                    yield delta
+
+        acc.response(model)
+
+    @property
+    def client(self) -> httpx.Client:
+        """Sync connection pool, opened on first use (async-only callers never need it)."""
+        if self._sclient is None:
+            self._sclient = httpx.Client(
+                base_url=self.BASE_URL,
+                headers=self._headers,
+                timeout=self.timeout,
+                # http2/limits must live on the transport when one is passed
+                transport=httpx.HTTPTransport(
+                    http2=_HTTP2,
+                    limits=self.POOL_LIMITS,
+                    retries=2,
+                ),
+            )
+        return self._sclient
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """
+        Get the async client for the running event loop.
+
+        httpx async connections are bound to the loop that opened them,
+        so a new pool is created if the loop changes (e.g. between
+        separate asyncio.run() calls); the old one is released first.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._release_async_pool()
+            self._aclient = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers=self._headers,
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=_HTTP2,
+                    limits=self.ASYNC_POOL_LIMITS,
+                    retries=2,
+                ),
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def achat(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        timeout: Optional[float] = None,
+        fallback: Optional[str] = None,
+        stop: Optional[List[str]] = None,
+    ) -> NearAIResponse:
+        """Async version of chat()."""
+        call_end = None if timeout is None else time.monotonic() + timeout
+        body = self._request_body(model, messages, temperature, max_tokens, stop)
+        resp = await self._apost_completion(model, body, timeout)
+        try:
+            return self._parse_response(model, _json_loads(resp.content))
+        except EmptyContentError as err:
+            if fallback is None:
+                raise
+            logger.warning(f"{err} Retrying with {fallback}")
+            try:
+                response = await self.achat(
+                    fallback,
+                    messages,
+                    temperature,
+                    max_tokens * 2,
+                    self._time_left(call_end),
+                    stop=stop,
+                )
+            except Exception as fallback_err:
+                raise FallbackFailedError(model, fallback, err, fallback_err) from fallback_err
+            response.used_fallback = True
+            return response
+
+    async def achat_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run many chat completions concurrently.
+
+        Requests start no faster than the client's rpm limit, if set.
+
+        Args:
+            requests: List of achat() keyword argument dicts
+                      (model, messages, temperature, max_tokens)
+            max_concurrency: Maximum requests in flight at once
+                             (default: the client's max_concurrency)
+
+        Returns:
+            Results in input order. A failed request is returned as
+            its exception instead of aborting the whole batch.
+        """
+        sem = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        limiter = self._limiter
+
+        async def run(kwargs: Dict[str, Any]) -> NearAIResponse:
+            async with sem:
+                if limiter is not None:
+                    await limiter.acquire()
+                return await self.achat(**kwargs)
+
+        return await asyncio.gather(
+            *(run(kwargs) for kwargs in requests), return_exceptions=True
+        )
+
+    def chat_many(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Any]:
+        """Synchronous wrapper around achat_batch() for non-async callers."""
+        return self.run_sync(self.achat_batch(requests, max_concurrency))
+
+    @staticmethod
+    def cost_for(model: str, input_tokens: int, output_tokens: int) -> float:
+        """Estimated cost in USD of a call, from AVAILABLE_MODELS pricing."""
+        cost_in, cost_out = _COST_COEFFS.get(model, _DEFAULT_COST_COEFFS)
+        return input_tokens * cost_in + output_tokens * cost_out
+
+    def list_models(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        List available models on NEAR AI Cloud.
+
+        The catalog changes rarely, so it is cached for models_ttl
+        seconds. Pass force_refresh=True to bypass the cache.
+        """
+        now = time.monotonic()
+        if not force_refresh and self._models_cache is not None:
+            fetched_at, models = self._models_cache
+            if now - fetched_at < self.models_ttl:
+                return list(models)
 
-    def list_models(self) -> List[Dict[str, Any]]:
-        """List available models on NEAR AI Cloud."""
         resp = self.client.get("/models")
         resp.raise_for_status()
-        return resp.json()["data"]
+        models = _json_loads(resp.content)["data"]
+        for info in models:
+            if isinstance(info.get("id"), str):
+                info["id"] = sys.intern(info["id"])
+        self._models_cache = (now, models)
+        return list(models)
+
+    def run_sync(self, coro: Awaitable[Any]) -> Any:
+        """
+        Run a coroutine to completion from sync code via asyncio.run().
+
+        The async pool is bound to that short-lived event loop, so it is
+        closed before the loop ends instead of being left open.
+        """
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self._aclose_async_pool()
+
+        return asyncio.run(runner())
+
+    async def _aclose_async_pool(self):
+        if self._aclient is not None:
+            await self._aclient.aclose()
+        self._aclient = None
+        self._aclient_loop = None
+
+    def _release_async_pool(self):
+        """
+        Close an async pool from outside its event loop, if that is possible.
+
+        It can be closed when its loop is idle but still open and no other
+        loop is running in this thread. Otherwise it is dropped with a
+        warning: use aclose(), ``async with`` or run_sync() to close it
+        properly.
+        """
+        aclient, loop = self._aclient, self._aclient_loop
+        self._aclient = None
+        self._aclient_loop = None
+        if aclient is None or aclient.is_closed:
+            return
+        try:
+            asyncio.get_running_loop()
+            in_loop = True
+        except RuntimeError:
+            in_loop = False
+        if loop is not None and not in_loop and not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(aclient.aclose())
+            return
+        logger.warning(
+            "NearAIClient async pool was still open and could not be closed "
+            "from here; use aclose() or 'async with' inside its event loop"
+        )
 
     def close(self):
-        self.client.close()
+        """Close the sync pool (and the async pool, if it can be closed from here)."""
+        if self._sclient is not None:
+            self._sclient.close()
+            self._sclient = None
+        self._release_async_pool()
+
+    async def aclose(self):
+        """Close both connection pools (call from the async pool's event loop)."""
+        await self._aclose_async_pool()
+        self.close()
+
+    def __enter__(self) -> "NearAIClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self) -> "NearAIClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
 
 # =========================================================
 # Cascade Controller
 # =========================================================
 
+def _extract_first_json(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object in model output, or None.
+
+    Tracks brace depth outside JSON strings, so braces inside strings
+    are ignored and prose or a second object after the first one isn't
+    swept into it. String bodies are skipped with str.find rather than
+    walked character by character.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    i = start
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch == '"':
+            # Jump to the closing quote: one preceded by an even number
+            # of backslashes
+            end = text.find('"', i + 1)
+            while end > 0:
+                k = end
+                while text[k - 1] == "\\":
+                    k -= 1
+                if (end - k) % 2 == 0:
+                    break
+                end = text.find('"', end + 1)
+            if end < 0:
+                return None
+            i = end + 1
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+        i += 1
+    return None
+
+
+# Static scoring rubric, sent as the first (system) message of every
+# evaluation so providers that cache prompt prefixes can reuse it;
+# the conversation follows it, then a short fixed instruction so the
+# model's last turn is always a request for the score.
+EVAL_RUBRIC_STATIC = (
+    "You are the PAICE Evaluator. Analyze the conversation and "
+    "score 5 collaboration dimensions on a 0-100 scale.\n\n"
+    "SCORING CALIBRATION (critical - do not inflate):\n"
+    "- 0-29: Constrained - minimal engagement, no iteration\n"
+    "- 30-49: Informed - some task clarity, occasional verification\n"
+    "- 50-69: Proficient - regular iteration, consistent verification\n"
+    "- 70-89: Advanced - systematic verification, proactive refinement\n"
+    "- 90-100: Exceptional - catches subtle issues, innovative approaches\n\n"
+    "IMPORTANT: Most typical conversations score 20-40. Productive "
+    "conversations score 40-55. Score only demonstrated behaviors. "
+    "Absence of evidence = default to 30. Short conversations with "
+    "only 1-3 exchanges should rarely exceed 40 overall. "
+    "Do NOT artificially inflate.\n\n"
+    "DIMENSIONS:\n"
+    "- Performance: How they frame tasks and evaluate results\n"
+    "- Accountability: How they verify outputs and handle errors\n"
+    "- Integrity: How they maintain accuracy and context\n"
+    "- Collaboration: How they iterate and refine with AI\n"
+    "- Evolution: How they learn and adapt their approach\n\n"
+    "Return ONLY valid JSON in this exact format:\n"
+    '{"overall_score": 35, "dimensions": {"Performance": 38, '
+    '"Accountability": 30, "Integrity": 35, "Collaboration": 32, '
+    '"Evolution": 30}, "summary": "Brief 1-sentence assessment summary"}'
+)
+_EVAL_RUBRIC_MESSAGE = {"role": "system", "content": EVAL_RUBRIC_STATIC}
+_EVAL_INSTRUCTION_MESSAGE = {
+    "role": "user",
+    "content": "Score the conversation above; return only the JSON.",
+}
+
+# Middleware QA prompt: fixed system message, per-call user message
+_MW_SYSTEM_MSG = {
+    "role": "system",
+    "content": (
+        "You are a PAICE quality assurance middleware. "
+        "Analyze the AI assessor's latest response and check for: "
+        "1. Did the assessor ask a relevant probing question? "
+        "2. Is the response staying on-topic for AI collaboration assessment? "
+        "3. Did the assessor avoid giving away scoring criteria? "
+        "4. Is the response appropriately concise (not too long/short)? "
+        'Respond with brief JSON: {"pass": true/false, "note": "brief reason"}.'
+    ),
+}
+_MW_USER_TEMPLATE = (
+    'AI assessor\'s latest response: "{ai_response}"\n\n'
+    "Context: This is exchange #{exchange_count} of a PAICE "
+    "AI collaboration assessment. Evaluate quality."
+)
+
+
 @dataclass
 class CascadeResult:
     """Result from a cascade layer call."""
@@ -199,9 +988,79 @@ class CascadeStats:
     calls: int = 0
     fallbacks: int = 0
     flagged: int = 0  # middleware only
+    cached: int = 0  # responses (or middleware verdicts) served from cache
     last_model: Optional[str] = None
 
 
+class _LayerIdx(IntEnum):
+    """Index of a cascade layer in the controller's counter arrays."""
+    CHAT = 0
+    MIDDLEWARE = 1
+    EVAL = 2
+
+
+_LAYER_IDX = MappingProxyType({
+    "chat": _LayerIdx.CHAT,
+    "middleware": _LayerIdx.MIDDLEWARE,
+    "eval": _LayerIdx.EVAL,
+})
+
+
+class LLMCache:
+    """
+    Exact-match cache of cascade results for deterministic calls.
+
+    CascadeController consults it only when a layer's temperature is 0,
+    keyed by a hash of the model, sampling arguments and messages.
+    Entries are kept in an in-process LRU unless a backend is given:
+    any object with get(key) -> Optional[bytes] and set(key, value)
+    methods (a redis.Redis client, for example) to share entries
+    between processes.
+    """
+
+    def __init__(self, maxsize: int = 1024, backend: Any = None):
+        self.maxsize = maxsize
+        self.backend = backend
+        self._entries: "OrderedDict[str, CascadeResult]" = OrderedDict()
+        # Reads reorder the LRU, so threaded callers need both guarded
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Cache key for one completion request."""
+        return _cache_key_hash(_canonical_json({
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }))
+
+    def get(self, key: str) -> Optional[CascadeResult]:
+        if self.backend is not None:
+            raw = self.backend.get(key)
+            return CascadeResult(**_json_loads(raw)) if raw is not None else None
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+        return result
+
+    def set(self, key: str, result: CascadeResult):
+        if self.backend is not None:
+            self.backend.set(key, _canonical_json(asdict(result)))
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
 class CascadeController:
     """
     Three-layer model cascade for PAICE assessment.
@@ -213,28 +1072,157 @@ class CascadeController:
 
     Each layer has a primary and fallback model. If the primary
     fails, the fallback is automatically tried.
+
+    All layers share the given NearAIClient, so every call in the
+    cascade reuses the same pooled connection.
     """
 
-    def __init__(self, client: NearAIClient, config=None):
+    # Middleware verdicts are memoized only for deterministic (temperature 0) calls
+    MIDDLEWARE_CACHE_SIZE = 4096
+    # How long achat_turn() waits for the previous turn's background check
+    MIDDLEWARE_AWAIT_TIMEOUT = 2.0
+    # Middleware verdicts are ~20-token JSON objects: cap the budget and
+    # stop generating as soon as the object closes
+    MIDDLEWARE_MAX_TOKENS = 64
+    MIDDLEWARE_STOP = ("}",)
+
+    def __init__(self, client: NearAIClient, config=None, cache: Optional[LLMCache] = None):
         """
         Initialize the cascade controller.
 
         Args:
-            client: NearAIClient instance
+            client: Shared NearAIClient instance
             config: CascadeConfig from near_config.py (or None for defaults)
+            cache: LLMCache for temperature-0 layers (default: in-memory)
         """
         self.client = client
+        self.cache = cache if cache is not None else LLMCache()
 
         if config is None:
             from near_config import CascadeConfig
             config = CascadeConfig()
 
         self.config = config
-        self.stats = {
-            "chat": CascadeStats(),
-            "middleware": CascadeStats(),
-            "eval": CascadeStats(),
-        }
+
+        # Counters laid out per field, indexed by _LayerIdx; one lock
+        # covers them all so threaded callers can share a controller
+        n_layers = len(_LayerIdx)
+        self._stats_lock = threading.Lock()
+        self._calls = array("q", bytes(8 * n_layers))
+        self._fallbacks = array("q", bytes(8 * n_layers))
+        self._flagged = array("q", bytes(8 * n_layers))
+        self._cached = array("q", bytes(8 * n_layers))
+        self._last_model: List[Optional[str]] = [None] * n_layers
+        # Verdict LRU; reads reorder it, so lookups are locked too
+        self._middleware_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._pending_middleware: Optional["asyncio.Task[Optional[Dict]]"] = None
+        self.last_verdict: Optional[Dict] = None
+
+        # Layer configs are frozen, so bind each layer's models and sampling
+        # arguments once instead of walking the config on every call.
+        bind = functools.partial
+        chat_kw = self._layer_kwargs("chat")
+        mw_kw = self._layer_kwargs("middleware")
+        mw_kw.update(
+            max_tokens=min(mw_kw["max_tokens"], self.MIDDLEWARE_MAX_TOKENS),
+            stop=list(self.MIDDLEWARE_STOP),
+        )
+        eval_kw = dict(self._layer_kwargs("eval"), fallback_on_empty=True)
+        self._chat_call = bind(self._call_with_fallback, layer="chat", **chat_kw)
+        self._achat_call = bind(self._acall_with_fallback, layer="chat", **chat_kw)
+        self._middleware_call = bind(self._call_with_fallback, layer="middleware", **mw_kw)
+        self._amiddleware_call = bind(self._acall_with_fallback, layer="middleware", **mw_kw)
+        self._eval_call = bind(self._call_with_fallback, layer="eval", **eval_kw)
+        self._aeval_call = bind(self._acall_with_fallback, layer="eval", **eval_kw)
+
+    def _result(
+        self,
+        layer: str,
+        model_id: str,
+        response: NearAIResponse,
+        elapsed: float,
+        used_fallback: bool,
+    ) -> CascadeResult:
+        """Record layer stats and build the CascadeResult for a response."""
+        cost = self.client.cost_for(model_id, response.input_tokens, response.output_tokens)
+
+        short_name = _short(model_id)
+        i = _LAYER_IDX[layer]
+        with self._stats_lock:
+            self._calls[i] += 1
+            if used_fallback:
+                self._fallbacks[i] += 1
+            self._last_model[i] = short_name
+
+        logger.info(
+            f"[{layer}] {'Fallback' if used_fallback else 'Primary'} "
+            f"responded in {elapsed:.1f}s"
+        )
+
+        return CascadeResult(
+            content=response.content,
+            model=short_name,
+            model_id=model_id,
+            used_fallback=used_fallback,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            latency=elapsed,
+            cost=cost,
+        )
+
+    @property
+    def stats(self) -> Dict[str, CascadeStats]:
+        """Snapshot of per-layer statistics (copies; editing them changes nothing)."""
+        with self._stats_lock:
+            return {
+                layer: CascadeStats(
+                    calls=self._calls[i],
+                    fallbacks=self._fallbacks[i],
+                    flagged=self._flagged[i],
+                    cached=self._cached[i],
+                    last_model=self._last_model[i],
+                )
+                for layer, i in _LAYER_IDX.items()
+            }
+
+    def _count_cached(self, layer: str):
+        with self._stats_lock:
+            self._cached[_LAYER_IDX[layer]] += 1
+
+    def _cache_key(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> Optional[str]:
+        """LLMCache key for a deterministic (temperature 0) call, else None."""
+        if temperature != 0:
+            return None
+        return self.cache.key(model, messages, temperature, max_tokens)
+
+    def _cached_result(self, layer: str, key: Optional[str]) -> Optional[CascadeResult]:
+        """Serve a cached result for free and instantly, if there is one."""
+        if key is None:
+            return None
+        result = self.cache.get(key)
+        if result is None:
+            return None
+        self._count_cached(layer)
+        logger.info(f"[{layer}] Served from cache")
+        return replace(result, latency=0.0, cost=0.0)
+
+    def _cache_store(self, key: Optional[str], result: CascadeResult) -> CascadeResult:
+        """
+        Cache a result the primary produced.
+
+        The key names the primary model, so a fallback answer (e.g. after
+        one transient primary error) is returned but never stored under it.
+        """
+        if key is not None and not result.used_fallback:
+            self.cache.set(key, result)
+        return result
 
     def _call_with_fallback(
         self,
@@ -244,109 +1232,405 @@ class CascadeController:
         max_tokens: int,
         primary_model: str,
         fallback_model: str,
+        deadline: Optional[float] = None,
+        fallback_on_empty: bool = False,
+        stop: Optional[List[str]] = None,
     ) -> CascadeResult:
         """
         Call a model with automatic fallback.
 
         Tries the primary model first. If it fails (API error,
         empty content, timeout), falls back to the secondary model.
+        With fallback_on_empty, the client switches to the fallback
+        itself on empty content (doubling max_tokens), saving a round
+        trip through the error path.
+
+        If a deadline (time.monotonic() value) is given, neither call is
+        sent once it has passed, and each request's HTTP timeout is
+        capped at the time remaining.
+
+        At temperature 0 the result is looked up in self.cache, keyed on
+        the primary model; only the primary's own results are added to it.
         """
-        pricing = self.client.AVAILABLE_MODELS
+        key = self._cache_key(primary_model, messages, temperature, max_tokens)
+        cached = self._cached_result(layer, key)
+        if cached is not None:
+            return cached
 
         # Try primary
         start = time.time()
         try:
+            timeout = self._request_timeout(layer, deadline)
             logger.info(f"[{layer}] Calling primary: {primary_model}")
             response = self.client.chat(
                 model=primary_model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                timeout=timeout,
+                fallback=fallback_model if fallback_on_empty else None,
+                stop=stop,
+            )
+            model_id = fallback_model if response.used_fallback else primary_model
+            return self._cache_store(
+                key,
+                self._result(layer, model_id, response, time.time() - start, response.used_fallback),
+            )
+
+        except Exception as primary_err:
+            if isinstance(primary_err, TimeoutError) and self._deadline_passed(deadline):
+                raise
+            if isinstance(primary_err, FallbackFailedError):
+                # The client already tried the fallback after an empty reply
+                raise self._both_failed(
+                    layer, primary_model, primary_err.empty_error,
+                    fallback_model, primary_err.fallback_error, deadline,
+                ) from primary_err
+            logger.warning(f"[{layer}] Primary failed: {primary_err}")
+
+            # Try fallback
+            start = time.time()
+            try:
+                timeout = self._request_timeout(layer, deadline)
+                logger.info(f"[{layer}] Falling back to: {fallback_model}")
+                response = self.client.chat(
+                    model=fallback_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout,
+                    stop=stop,
+                )
+                return self._result(layer, fallback_model, response, time.time() - start, True)
+
+            except Exception as fallback_err:
+                raise self._both_failed(
+                    layer, primary_model, primary_err, fallback_model, fallback_err, deadline
+                ) from fallback_err
+
+    async def _acall_with_fallback(
+        self,
+        layer: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        primary_model: str,
+        fallback_model: str,
+        deadline: Optional[float] = None,
+        fallback_on_empty: bool = False,
+        stop: Optional[List[str]] = None,
+    ) -> CascadeResult:
+        """
+        Async version of _call_with_fallback().
+
+        If config.hedge_delay is set, a slow primary is raced against the
+        fallback instead of waiting for it to fail (see _ahedged_call).
+        """
+        key = self._cache_key(primary_model, messages, temperature, max_tokens)
+        cached = self._cached_result(layer, key)
+        if cached is not None:
+            return cached
+
+        if self.config.hedge_delay is not None:
+            return self._cache_store(key, await self._ahedged_call(
+                layer, messages, temperature, max_tokens,
+                primary_model, fallback_model, deadline, fallback_on_empty, stop,
+            ))
+
+        start = time.time()
+        try:
+            timeout = self._request_timeout(layer, deadline)
+            logger.info(f"[{layer}] Calling primary: {primary_model}")
+            response = await asyncio.wait_for(
+                self.client.achat(
+                    model=primary_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout,
+                    fallback=fallback_model if fallback_on_empty else None,
+                    stop=stop,
+                ),
+                self._remaining(deadline),
             )
-            elapsed = time.time() - start
+            model_id = fallback_model if response.used_fallback else primary_model
+            return self._cache_store(
+                key,
+                self._result(layer, model_id, response, time.time() - start, response.used_fallback),
+            )
+
+        except Exception as primary_err:
+            if isinstance(primary_err, TimeoutError) and self._deadline_passed(deadline):
+                raise
+            if isinstance(primary_err, FallbackFailedError):
+                # The client already tried the fallback after an empty reply
+                raise self._both_failed(
+                    layer, primary_model, primary_err.empty_error,
+                    fallback_model, primary_err.fallback_error, deadline,
+                ) from primary_err
+            logger.warning(f"[{layer}] Primary failed: {primary_err}")
+
+            start = time.time()
+            try:
+                timeout = self._request_timeout(layer, deadline)
+                logger.info(f"[{layer}] Falling back to: {fallback_model}")
+                response = await asyncio.wait_for(
+                    self.client.achat(
+                        model=fallback_model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        timeout=timeout,
+                        stop=stop,
+                    ),
+                    self._remaining(deadline),
+                )
+                return self._result(layer, fallback_model, response, time.time() - start, True)
 
-            p = pricing.get(primary_model, {"input": 1.0, "output": 3.0})
-            cost = (response.input_tokens * p["input"] + response.output_tokens * p["output"]) / 1e6
+            except Exception as fallback_err:
+                raise self._both_failed(
+                    layer, primary_model, primary_err, fallback_model, fallback_err, deadline
+                ) from fallback_err
 
-            self.stats[layer].calls += 1
-            self.stats[layer].last_model = primary_model.split("/")[-1]
+    async def _ahedged_call(
+        self,
+        layer: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        primary_model: str,
+        fallback_model: str,
+        deadline: Optional[float] = None,
+        fallback_on_empty: bool = False,
+        stop: Optional[List[str]] = None,
+    ) -> CascadeResult:
+        """
+        Hedged primary/fallback call.
 
-            logger.info(f"[{layer}] Primary responded in {elapsed:.1f}s")
+        The primary is sent at once. If it has not answered within
+        config.hedge_delay seconds, or fails sooner, the fallback is sent
+        as well and the first successful response wins; the other request
+        is cancelled. Latency on a stalled primary is then bounded by
+        hedge_delay + fallback latency rather than a full timeout.
+        """
 
-            return CascadeResult(
-                content=response.content,
-                model=primary_model.split("/")[-1],
-                model_id=primary_model,
-                used_fallback=False,
-                input_tokens=response.input_tokens,
-                output_tokens=response.output_tokens,
-                latency=elapsed,
-                cost=cost,
+        async def attempt(model: str, empty_fallback: Optional[str] = None):
+            timeout = self._request_timeout(layer, deadline)
+            start = time.time()
+            response = await asyncio.wait_for(
+                self.client.achat(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout,
+                    fallback=empty_fallback,
+                    stop=stop,
+                ),
+                self._remaining(deadline),
             )
+            return response, time.time() - start
+
+        logger.info(f"[{layer}] Calling primary: {primary_model}")
+        primary = asyncio.create_task(
+            attempt(primary_model, fallback_model if fallback_on_empty else None)
+        )
+        pending = {primary}
+        errors: Dict[str, BaseException] = {}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.config.hedge_delay)
+            while True:
+                for task in done:
+                    model_id = primary_model if task is primary else fallback_model
+                    err = task.exception()
+                    if err is None:
+                        response, elapsed = task.result()
+                        used_fallback = task is not primary or response.used_fallback
+                        return self._result(
+                            layer,
+                            fallback_model if used_fallback else primary_model,
+                            response,
+                            elapsed,
+                            used_fallback,
+                        )
+                    logger.warning(f"[{layer}] {model_id} failed: {err}")
+                    if isinstance(err, FallbackFailedError):
+                        # Empty primary reply; the client's own fallback call failed
+                        errors[primary_model] = err.empty_error
+                        errors[fallback_model] = err.fallback_error
+                    else:
+                        errors[model_id] = err
+
+                if fallback_model not in errors and len(pending) + len(errors) < 2:
+                    logger.info(f"[{layer}] Hedging with fallback: {fallback_model}")
+                    pending.add(asyncio.create_task(attempt(fallback_model)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if self._deadline_passed(deadline):
+            raise TimeoutError(f"[{layer}] Deadline passed before either model answered")
+        raise self._both_failed(
+            layer,
+            primary_model,
+            errors.get(primary_model),
+            fallback_model,
+            errors.get(fallback_model),
+            deadline,
+        )
+
+    def _request_timeout(self, layer: str, deadline: Optional[float]) -> Optional[float]:
+        """
+        HTTP timeout for the next request under a caller deadline.
+
+        Raises TimeoutError without dispatching if the deadline has
+        already passed (e.g. the web request was cancelled), so no
+        inference is paid for a result nobody will read.
+        """
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"[{layer}] Deadline passed; request not sent")
+        return min(remaining, self.client.timeout)
+
+    def _both_failed(
+        self,
+        layer: str,
+        primary_model: str,
+        primary_err: BaseException,
+        fallback_model: str,
+        fallback_err: BaseException,
+        deadline: Optional[float],
+    ) -> Exception:
+        """Exception to raise once neither model produced a result."""
+        if isinstance(fallback_err, TimeoutError) and self._deadline_passed(deadline):
+            return fallback_err
+        return RuntimeError(
+            f"[{layer}] Both models failed. "
+            f"Primary ({primary_model}): {primary_err}. "
+            f"Fallback ({fallback_model}): {fallback_err}"
+        )
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """Seconds left before a monotonic deadline (None if there is none)."""
+        return None if deadline is None else max(deadline - time.monotonic(), 0.0)
 
-        except Exception as primary_err:
-            logger.warning(f"[{layer}] Primary failed: {primary_err}")
+    @staticmethod
+    def _deadline_passed(deadline: Optional[float]) -> bool:
+        """
+        True once a caller deadline has expired.
 
-            # Try fallback
-            start = time.time()
-            try:
-                logger.info(f"[{layer}] Falling back to: {fallback_model}")
-                response = self.client.chat(
-                    model=fallback_model,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-                elapsed = time.time() - start
-
-                p = pricing.get(fallback_model, {"input": 1.0, "output": 3.0})
-                cost = (response.input_tokens * p["input"] + response.output_tokens * p["output"]) / 1e6
-
-                self.stats[layer].calls += 1
-                self.stats[layer].fallbacks += 1
-                self.stats[layer].last_model = fallback_model.split("/")[-1]
-
-                logger.info(f"[{layer}] Fallback responded in {elapsed:.1f}s")
-
-                return CascadeResult(
-                    content=response.content,
-                    model=fallback_model.split("/")[-1],
-                    model_id=fallback_model,
-                    used_fallback=True,
-                    input_tokens=response.input_tokens,
-                    output_tokens=response.output_tokens,
-                    latency=elapsed,
-                    cost=cost,
-                )
+        Only then is a TimeoutError re-raised; a request that merely
+        timed out on its own counts as a model failure and falls back.
+        """
+        return deadline is not None and time.monotonic() >= deadline
 
-            except Exception as fallback_err:
-                raise RuntimeError(
-                    f"[{layer}] Both models failed. "
-                    f"Primary ({primary_model}): {primary_err}. "
-                    f"Fallback ({fallback_model}): {fallback_err}"
-                )
+    def _layer_kwargs(self, layer: str) -> Dict[str, Any]:
+        """Model and sampling arguments for a cascade layer."""
+        cfg = getattr(self.config, layer)
+        return {
+            "temperature": cfg.temperature,
+            "max_tokens": cfg.max_tokens,
+            # Env-sourced IDs are fresh strings; interned they match the catalog keys
+            "primary_model": sys.intern(cfg.primary),
+            "fallback_model": sys.intern(cfg.fallback),
+        }
 
-    def chat(self, messages: List[Dict[str, str]]) -> CascadeResult:
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        deadline: Optional[float] = None,
+    ) -> CascadeResult:
         """
         Chat layer: conduct the assessment conversation.
 
         Uses GPT OSS 120B (primary) or DeepSeek V3.1 (fallback).
+        Raises TimeoutError if the optional monotonic deadline passes.
         """
-        cfg = self.config.chat
-        return self._call_with_fallback(
-            layer="chat",
-            messages=messages,
-            temperature=cfg.temperature,
-            max_tokens=cfg.max_tokens,
-            primary_model=cfg.primary,
-            fallback_model=cfg.fallback,
-        )
+        return self._chat_call(messages=messages, deadline=deadline)
+
+    async def achat(
+        self,
+        messages: List[Dict[str, str]],
+        deadline: Optional[float] = None,
+    ) -> CascadeResult:
+        """Async version of chat()."""
+        return await self._achat_call(messages=messages, deadline=deadline)
+
+    @staticmethod
+    def _middleware_messages(ai_response: str, exchange_count: int) -> List[Dict[str, str]]:
+        """Build the middleware QA prompt for an assessor response."""
+        return [
+            _MW_SYSTEM_MSG,
+            {
+                "role": "user",
+                "content": _MW_USER_TEMPLATE.format(
+                    ai_response=ai_response, exchange_count=exchange_count
+                ),
+            },
+        ]
+
+    def _middleware_cache_key(self, mw_messages: List[Dict[str, str]]) -> Optional[str]:
+        """Cache key for a middleware prompt, or None if caching is off."""
+        if self.config.middleware.temperature != 0:
+            return None
+        return _cache_key_hash(_canonical_json(mw_messages))
+
+    def _cached_verdict(self, key: Optional[str]) -> Optional[Dict]:
+        """Look up a memoized middleware verdict (LRU order is refreshed)."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self._middleware_cache.get(key)
+            if cached is None:
+                return None
+            self._middleware_cache.move_to_end(key)
+            mw_data = dict(cached)
+        self._count_cached("middleware")
+        return self._count_verdict(mw_data)
+
+    def _middleware_verdict(self, result: CascadeResult, key: Optional[str]) -> Optional[Dict]:
+        """Parse the middleware JSON verdict, memoize it and count flags."""
+        raw = _extract_first_json(result.content)
+        if raw is None and "{" in result.content:
+            # Generation stops at "}", which most servers leave out
+            raw = _extract_first_json(result.content + "}")
+        if raw is not None:
+            mw_data = _json_loads(raw)
+            if key is not None:
+                with self._cache_lock:
+                    self._middleware_cache[key] = dict(mw_data)
+                    if len(self._middleware_cache) > self.MIDDLEWARE_CACHE_SIZE:
+                        self._middleware_cache.popitem(last=False)
+            return self._count_verdict(mw_data)
+        return None
 
-    def middleware_check(self, ai_response: str, exchange_count: int) -> Optional[Dict]:
+    def _count_verdict(self, mw_data: Dict) -> Dict:
+        """Count a failing middleware verdict as flagged."""
+        passed = mw_data.get("pass", True)
+        if not passed:
+            with self._stats_lock:
+                self._flagged[_LayerIdx.MIDDLEWARE] += 1
+        return mw_data
+
+    def middleware_check(
+        self,
+        ai_response: str,
+        exchange_count: int,
+        deadline: Optional[float] = None,
+    ) -> Optional[Dict]:
         """
         Middleware layer: QA validation of AI response.
 
         Uses Qwen3 30B (primary) or DeepSeek V3.1 (fallback).
+        Skipped (returns None) if the optional monotonic deadline passes.
+        Verdicts for identical prompts are served from an LRU cache when
+        the middleware temperature is 0 (sampled verdicts are never reused).
 
         Returns:
             Dict with {"pass": bool, "note": str} or None if middleware disabled.
@@ -354,111 +1638,161 @@ class CascadeController:
         if not self.config.middleware_enabled:
             return None
 
-        mw_messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are a PAICE quality assurance middleware. "
-                    "Analyze the AI assessor's latest response and check for: "
-                    "1. Did the assessor ask a relevant probing question? "
-                    "2. Is the response staying on-topic for AI collaboration assessment? "
-                    "3. Did the assessor avoid giving away scoring criteria? "
-                    "4. Is the response appropriately concise (not too long/short)? "
-                    'Respond with brief JSON: {"pass": true/false, "note": "brief reason"}.'
-                ),
-            },
-            {
-                "role": "user",
-                "content": (
-                    f'AI assessor\'s latest response: "{ai_response}"\n\n'
-                    f"Context: This is exchange #{exchange_count} of a PAICE "
-                    f"AI collaboration assessment. Evaluate quality."
-                ),
-            },
-        ]
+        mw_messages = self._middleware_messages(ai_response, exchange_count)
+        key = self._middleware_cache_key(mw_messages)
+        cached = self._cached_verdict(key)
+        if cached is not None:
+            return cached
 
         try:
-            cfg = self.config.middleware
-            result = self._call_with_fallback(
-                layer="middleware",
-                messages=mw_messages,
-                temperature=cfg.temperature,
-                max_tokens=cfg.max_tokens,
-                primary_model=cfg.primary,
-                fallback_model=cfg.fallback,
-            )
+            result = self._middleware_call(messages=mw_messages, deadline=deadline)
+            return self._middleware_verdict(result, key)
+
+        except Exception as err:
+            logger.warning(f"[middleware] Skipped: {err}")
 
-            import re
-            json_match = re.search(r"\{[\s\S]*\}", result.content)
-            if json_match:
-                mw_data = json.loads(json_match.group())
-                passed = mw_data.get("pass", True)
-                if not passed:
-                    self.stats["middleware"].flagged += 1
-                return mw_data
+        return None
+
+    async def amiddleware_check(
+        self,
+        ai_response: str,
+        exchange_count: int,
+        deadline: Optional[float] = None,
+    ) -> Optional[Dict]:
+        """Async version of middleware_check()."""
+        if not self.config.middleware_enabled:
+            return None
+
+        mw_messages = self._middleware_messages(ai_response, exchange_count)
+        key = self._middleware_cache_key(mw_messages)
+        cached = self._cached_verdict(key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = await self._amiddleware_call(messages=mw_messages, deadline=deadline)
+            return self._middleware_verdict(result, key)
 
         except Exception as err:
             logger.warning(f"[middleware] Skipped: {err}")
 
         return None
 
-    def evaluate(self, messages: List[Dict[str, str]]) -> CascadeResult:
+    @staticmethod
+    def _eval_messages(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Wrap the conversation in the static rubric and scoring instruction."""
+        return [_EVAL_RUBRIC_MESSAGE, *messages, _EVAL_INSTRUCTION_MESSAGE]
+
+    def evaluate(
+        self,
+        messages: List[Dict[str, str]],
+        deadline: Optional[float] = None,
+    ) -> CascadeResult:
         """
         Evaluation layer: score the conversation across 5 PAICE dimensions.
 
         Uses GLM 4.7 (primary) or GPT OSS 120B (fallback).
         GLM 4.7 needs max_tokens=2000 for its reasoning process.
+        Raises TimeoutError if the optional monotonic deadline passes.
         """
-        eval_prompt = {
-            "role": "user",
-            "content": (
-                "You are the PAICE Evaluator. Analyze the conversation and "
-                "score 5 collaboration dimensions on a 0-100 scale.\n\n"
-                "SCORING CALIBRATION (critical - do not inflate):\n"
-                "- 0-29: Constrained - minimal engagement, no iteration\n"
-                "- 30-49: Informed - some task clarity, occasional verification\n"
-                "- 50-69: Proficient - regular iteration, consistent verification\n"
-                "- 70-89: Advanced - systematic verification, proactive refinement\n"
-                "- 90-100: Exceptional - catches subtle issues, innovative approaches\n\n"
-                "IMPORTANT: Most typical conversations score 20-40. Productive "
-                "conversations score 40-55. Score only demonstrated behaviors. "
-                "Absence of evidence = default to 30. Short conversations with "
-                "only 1-3 exchanges should rarely exceed 40 overall. "
-                "Do NOT artificially inflate.\n\n"
-                "DIMENSIONS:\n"
-                "- Performance: How they frame tasks and evaluate results\n"
-                "- Accountability: How they verify outputs and handle errors\n"
-                "- Integrity: How they maintain accuracy and context\n"
-                "- Collaboration: How they iterate and refine with AI\n"
-                "- Evolution: How they learn and adapt their approach\n\n"
-                "Return ONLY valid JSON in this exact format:\n"
-                '{"overall_score": 35, "dimensions": {"Performance": 38, '
-                '"Accountability": 30, "Integrity": 35, "Collaboration": 32, '
-                '"Evolution": 30}, "summary": "Brief 1-sentence assessment summary"}'
-            ),
-        }
+        return self._eval_call(messages=self._eval_messages(messages), deadline=deadline)
+
+    async def aevaluate(
+        self,
+        messages: List[Dict[str, str]],
+        deadline: Optional[float] = None,
+    ) -> CascadeResult:
+        """Async version of evaluate()."""
+        return await self._aeval_call(messages=self._eval_messages(messages), deadline=deadline)
+
+    async def arun_all(
+        self,
+        messages: List[Dict[str, str]],
+        ai_response: str,
+        exchange_count: int,
+        deadline: Optional[float] = None,
+    ) -> Tuple[CascadeResult, Optional[Dict], CascadeResult]:
+        """
+        Run the chat, middleware and evaluation layers concurrently.
+
+        The layers don't depend on each other's output: chat produces
+        the next assessor turn, middleware checks the previous one
+        (ai_response), and evaluation scores the conversation so far.
 
-        cfg = self.config.eval
-        return self._call_with_fallback(
-            layer="eval",
-            messages=[*messages, eval_prompt],
-            temperature=cfg.temperature,
-            max_tokens=cfg.max_tokens,
-            primary_model=cfg.primary,
-            fallback_model=cfg.fallback,
+        Returns:
+            Tuple of (chat result, middleware verdict, eval result)
+        """
+        return await asyncio.gather(
+            self.achat(messages, deadline),
+            self.amiddleware_check(ai_response, exchange_count, deadline),
+            self.aevaluate(messages, deadline),
         )
 
+    async def achat_turn(
+        self,
+        messages: List[Dict[str, str]],
+        exchange_count: int,
+        deadline: Optional[float] = None,
+    ) -> CascadeResult:
+        """
+        Chat layer with the middleware check taken off the critical path.
+
+        The reply is returned as soon as chat finishes; its middleware
+        check runs as a background task that overlaps the user's next
+        message and the next chat request. That verdict is collected
+        after the next chat() returns and stored in last_verdict (flags
+        are counted in stats as usual). Call amiddleware_verdict() at the
+        end of a session to collect the final one. All turns of a session
+        must run on the same event loop.
+        """
+        result = await self.achat(messages, deadline)
+        await self.amiddleware_verdict()
+        if self.config.middleware_enabled:
+            self._pending_middleware = asyncio.create_task(
+                self.amiddleware_check(result.content, exchange_count)
+            )
+        return result
+
+    async def amiddleware_verdict(self) -> Optional[Dict]:
+        """
+        Collect the background middleware check started by achat_turn().
+
+        Waits at most MIDDLEWARE_AWAIT_TIMEOUT seconds; a check still
+        running after that is cancelled, since its verdict is advisory.
+        """
+        task, self._pending_middleware = self._pending_middleware, None
+        if task is None:
+            return self.last_verdict
+        try:
+            self.last_verdict = await asyncio.wait_for(task, self.MIDDLEWARE_AWAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("[middleware] Background check timed out; skipped")
+            self.last_verdict = None
+        return self.last_verdict
+
+    def run_all(
+        self,
+        messages: List[Dict[str, str]],
+        ai_response: str,
+        exchange_count: int,
+        deadline: Optional[float] = None,
+    ) -> Tuple[CascadeResult, Optional[Dict], CascadeResult]:
+        """Synchronous wrapper around arun_all() for non-async callers."""
+        return self.client.run_sync(self.arun_all(messages, ai_response, exchange_count, deadline))
+
     def get_cascade_info(self) -> Dict[str, Any]:
         """Get current cascade configuration and statistics."""
+        stats = self.stats
         return {
             "layers": {
                 "chat": {
                     "primary": self.config.chat.primary,
                     "fallback": self.config.chat.fallback,
                     "stats": {
-                        "calls": self.stats["chat"].calls,
-                        "fallbacks": self.stats["chat"].fallbacks,
-                        "last_model": self.stats["chat"].last_model,
+                        "calls": stats["chat"].calls,
+                        "fallbacks": stats["chat"].fallbacks,
+                        "cached": stats["chat"].cached,
+                        "last_model": stats["chat"].last_model,
                     },
                 },
                 "middleware": {
@@ -466,19 +1800,21 @@ class CascadeController:
                     "fallback": self.config.middleware.fallback,
                     "enabled": self.config.middleware_enabled,
                     "stats": {
-                        "calls": self.stats["middleware"].calls,
-                        "fallbacks": self.stats["middleware"].fallbacks,
-                        "flagged": self.stats["middleware"].flagged,
-                        "last_model": self.stats["middleware"].last_model,
+                        "calls": stats["middleware"].calls,
+                        "fallbacks": stats["middleware"].fallbacks,
+                        "flagged": stats["middleware"].flagged,
+                        "cached": stats["middleware"].cached,
+                        "last_model": stats["middleware"].last_model,
                     },
                 },
                 "eval": {
                     "primary": self.config.eval.primary,
                     "fallback": self.config.eval.fallback,
                     "stats": {
-                        "calls": self.stats["eval"].calls,
-                        "fallbacks": self.stats["eval"].fallbacks,
-                        "last_model": self.stats["eval"].last_model,
+                        "calls": stats["eval"].calls,
+                        "fallbacks": stats["eval"].fallbacks,
+                        "cached": stats["eval"].cached,
+                        "last_model": stats["eval"].last_model,
                     },
                 },
             },
@@ -489,6 +1825,17 @@ class CascadeController:
 # PAICE Scoring Utilities
 # =========================================================
 
+# Display-score lower bounds of tiers I, P, A, E (below 300 is C)
+_TIER_CUTOFFS = (300, 500, 700, 900)
+_TIERS = (
+    ("C", "Constrained"),
+    ("I", "Informed"),
+    ("P", "Proficient"),
+    ("A", "Advanced"),
+    ("E", "Exceptional"),
+)
+
+
 def get_tier(stored_score: float) -> Dict[str, Any]:
     """
     Convert a stored score (0-100) to PAICE display scale (0-1000) and tier.
@@ -500,21 +1847,199 @@ def get_tier(stored_score: float) -> Dict[str, Any]:
         Dict with code, label, and display score
     """
     display = round(stored_score * 10)
-    if display >= 900:
-        return {"code": "E", "label": "Exceptional", "display": display}
-    if display >= 700:
-        return {"code": "A", "label": "Advanced", "display": display}
-    if display >= 500:
-        return {"code": "P", "label": "Proficient", "display": display}
-    if display >= 300:
-        return {"code": "I", "label": "Informed", "display": display}
-    return {"code": "C", "label": "Constrained", "display": display}
+    code, label = _TIERS[bisect.bisect_right(_TIER_CUTOFFS, display)]
+    return {"code": code, "label": label, "display": display}
+
+
+# Fixed-point resolution for quantized scores (basis points: 1.0 -> 10000)
+SCORE_BASIS_POINTS = 10_000
+
+
+def quantize_score(value: float, full_scale: float = 1.0) -> int:
+    """
+    Quantize a score to integer basis points of its full scale.
+
+    Integer scores serialize identically in every JSON encoder and
+    language, unlike floats, and fit in a u16 (0-10000). Rounds half
+    up (like JavaScript's Math.round) and clamps to the valid range.
+
+    Args:
+        value: Score on a 0..full_scale scale
+        full_scale: Maximum score (1.0 for 0-1 scores, 100 for stored scores)
+
+    Returns:
+        Integer in [0, SCORE_BASIS_POINTS]
+    """
+    bp = math.floor(value / full_scale * SCORE_BASIS_POINTS + 0.5)
+    return min(max(bp, 0), SCORE_BASIS_POINTS)
+
+
+# PAICE dimension order for score rows and weights
+DIMENSIONS = ("Performance", "Accountability", "Integrity", "Collaboration", "Evolution")
+
+
+def aggregate_scores(
+    dims: Sequence[float],
+    weights: Optional[Sequence[float]] = None,
+) -> List[float]:
+    """
+    Aggregate dimension scores into an overall score per session.
+
+    Takes scores as one flat row-major N x 5 sequence (e.g. an
+    array.array("d")) rather than a list of dicts, so evaluation
+    sweeps over many sessions run as a single tight loop.
+
+    Args:
+        dims: N x 5 dimension scores, row-major in DIMENSIONS order
+        weights: 5 dimension weights (default equal); normalized to sum to 1
+
+    Returns:
+        List of N overall scores on the same scale as the inputs
+    """
+    if len(dims) % len(DIMENSIONS):
+        raise ValueError(f"Expected N x {len(DIMENSIONS)} scores, got {len(dims)} values")
+    if weights is None:
+        weights = (1.0,) * len(DIMENSIONS)
+    if len(weights) != len(DIMENSIONS):
+        raise ValueError(f"Expected {len(DIMENSIONS)} weights, got {len(weights)}")
+
+    total = sum(weights)
+    wp, wa, wi, wc, we = (w / total for w in weights)
+    rows = iter(dims)
+    return [
+        p * wp + a * wa + i * wi + c * wc + e * we
+        for p, a, i, c, e in zip(rows, rows, rows, rows, rows)
+    ]
+
+
+# =========================================================
+# Canonical JSON
+# =========================================================
+
+# orjson matches json.dumps(sort_keys=True, separators=(",", ":")) byte
+# for byte except for non-ASCII text, DEL, NaN/Infinity (written as
+# null) and floats that stdlib writes in exponent form. Output that may
+# contain any of those is re-encoded with stdlib json instead.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+
+if orjson is not None:
+    _ORJSON_OPTS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+# Fixed PAICE score payload schema, pre-sorted for the fast path
+_SCORE_PAYLOAD_KEYS = frozenset(
+    {"session_id", "overall_score", "tier", "dimensions", "timestamp"}
+)
+_SCORE_DIMENSION_KEYS = frozenset(
+    {"Performance", "Accountability", "Integrity", "Collaboration", "Evolution"}
+)
+_SCORE_PAYLOAD_TEMPLATE = (
+    '{"dimensions":{"Accountability":%r,"Collaboration":%r,"Evolution":%r,'
+    '"Integrity":%r,"Performance":%r},"overall_score":%r,"session_id":%s,'
+    '"tier":%s,"timestamp":%r}'
+)
+
+
+def _orjson_canonical(obj: Any) -> Optional[bytes]:
+    """orjson encoding of obj if it is byte-identical to stdlib's, else None."""
+    try:
+        out = orjson.dumps(obj, option=_ORJSON_OPTS)
+    except TypeError:
+        return None
+    if (
+        not out.isascii()
+        or b"0e" in out.translate(_DIGITS_TO_ZERO)
+        or b"0.0000" in out
+        or b"null" in out
+        or b"\x7f" in out
+    ):
+        return None
+    return out
+
+
+def _score_fields_canonical(
+    session_id: Any,
+    overall_score: Any,
+    tier: Any,
+    dims_sorted: Tuple[Any, ...],
+    timestamp: Any,
+) -> Optional[bytes]:
+    """
+    Canonical JSON for score payload fields, or None if not encodable here.
+
+    dims_sorted holds the five dimension scores in key order
+    (Accountability, Collaboration, Evolution, Integrity, Performance).
+    """
+    if type(session_id) is not str or type(tier) is not str or type(timestamp) is not int:
+        return None
+    for value in (*dims_sorted, overall_score):
+        # bool is an int subclass and encodes differently; NaN/inf as NaN/Infinity
+        if type(value) is not int and (type(value) is not float or not math.isfinite(value)):
+            return None
+
+    return (_SCORE_PAYLOAD_TEMPLATE % (
+        *dims_sorted,
+        overall_score,
+        encode_basestring_ascii(session_id),
+        encode_basestring_ascii(tier),
+        timestamp,
+    )).encode()
+
+
+def _score_payload_canonical(payload: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Canonical JSON for the fixed score payload schema, or None.
+
+    Fills a pre-sorted template instead of walking and sorting the
+    dict. Any payload that deviates from the schema returns None.
+    """
+    if type(payload) is not dict or payload.keys() != _SCORE_PAYLOAD_KEYS:
+        return None
+    dims = payload["dimensions"]
+    if type(dims) is not dict or dims.keys() != _SCORE_DIMENSION_KEYS:
+        return None
+
+    return _score_fields_canonical(
+        payload["session_id"],
+        payload["overall_score"],
+        payload["tier"],
+        (
+            dims["Accountability"],
+            dims["Collaboration"],
+            dims["Evolution"],
+            dims["Integrity"],
+            dims["Performance"],
+        ),
+        payload["timestamp"],
+    )
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """
+    Serialize to canonical JSON bytes (sorted keys, no whitespace).
+
+    Output is identical to json.dumps(obj, sort_keys=True,
+    separators=(",", ":")).encode(), so hashes stay stable whichever
+    encoder is used.
+    """
+    out = _orjson_canonical(obj) if orjson is not None else _score_payload_canonical(obj)
+    if out is not None:
+        return out
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
 
 
 # =========================================================
 # Assessment Attestation
 # =========================================================
 
+# Worker threads for compute_hash_async(); started on first use
+_HASH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="paice-hash")
+
+
 @dataclass
 class AttestationResult:
     """Result of writing an attestation to NEAR."""
@@ -534,6 +2059,88 @@ class VerificationResult:
     timestamp: Optional[int] = None
 
 
+def _number_column(values: List[Any], name: str) -> array:
+    """Pack a score column into an int64 or float64 array without changing its JSON form."""
+    kinds = set(map(type, values))
+    if kinds <= {int}:
+        return array("q", values)
+    if kinds <= {float}:
+        return array("d", values)
+    raise ValueError(
+        f"{name} must be all int or all float (got {sorted(k.__name__ for k in kinds)}); "
+        f"anything else would change the payload hash"
+    )
+
+
+@dataclass
+class ScoreBatch:
+    """
+    Column-oriented (SoA) batch of fixed-schema score payloads.
+
+    Holds many {session_id, overall_score, tier, dimensions, timestamp}
+    payloads as packed arrays instead of one dict per session, for bulk
+    attestation and verification sweeps. Integer columns stay integers
+    so hashes match compute_hash() on the original dicts.
+    """
+    session_ids: List[str]
+    tiers: List[str]
+    overall_scores: array
+    dimensions: array  # N x 5, row-major in DIMENSIONS order
+    timestamps: array
+
+    @classmethod
+    def from_dicts(cls, payloads: List[Dict[str, Any]]) -> "ScoreBatch":
+        """Build a batch from score payload dicts (converted once, at the boundary)."""
+        for payload in payloads:
+            if payload.keys() != _SCORE_PAYLOAD_KEYS or payload["dimensions"].keys() != _SCORE_DIMENSION_KEYS:
+                raise ValueError(f"Payload does not match the score schema: {sorted(payload)}")
+        return cls(
+            session_ids=[p["session_id"] for p in payloads],
+            tiers=[p["tier"] for p in payloads],
+            overall_scores=_number_column([p["overall_score"] for p in payloads], "overall_score"),
+            dimensions=_number_column(
+                [p["dimensions"][d] for p in payloads for d in DIMENSIONS], "dimensions"
+            ),
+            timestamps=array("q", [p["timestamp"] for p in payloads]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.session_ids)
+
+    def _rows(self):
+        """Iterate (session_id, overall_score, tier, dims, timestamp) per payload."""
+        dims = iter(self.dimensions)
+        return zip(
+            self.session_ids,
+            self.overall_scores,
+            self.tiers,
+            zip(dims, dims, dims, dims, dims),
+            self.timestamps,
+        )
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert back to score payload dicts."""
+        return [
+            {
+                "session_id": session_id,
+                "overall_score": overall_score,
+                "tier": tier,
+                "dimensions": dict(zip(DIMENSIONS, dims)),
+                "timestamp": timestamp,
+            }
+            for session_id, overall_score, tier, dims, timestamp in self._rows()
+        ]
+
+    def compute_hashes(self) -> List[str]:
+        """compute_hash() for every payload, read straight from the columns."""
+        hash_fields = AttestationService._hash_score_payload_fast
+        return [hash_fields(*row) for row in self._rows()]
+
+    def aggregate(self, weights: Optional[Sequence[float]] = None) -> List[float]:
+        """Weighted overall score per session (see aggregate_scores)."""
+        return aggregate_scores(self.dimensions, weights)
+
+
 class AttestationService:
     """
     Writes and verifies assessment attestations on NEAR blockchain.
@@ -549,10 +2156,50 @@ class AttestationService:
         "mainnet": "https://rpc.mainnet.near.org",
     }
 
-    def __init__(self, contract_id: str, network: str = "testnet"):
+    RPC_TIMEOUT = 10.0
+    RPC_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+    RPC_HEADERS = {"User-Agent": "paice-near/1.0"}
+    # Encoded once: get_attestation_count() takes no arguments
+    _EMPTY_ARGS_B64 = base64.b64encode(b"{}").decode()
+
+    def __init__(self, contract_id: str, network: str = "testnet", count_ttl: float = 0.0):
+        """
+        Initialize the attestation service.
+
+        Args:
+            contract_id: Attestation contract account
+            network: "testnet" or "mainnet"
+            count_ttl: Seconds to cache get_attestation_count() (0 disables),
+                       useful when a dashboard polls it
+        """
         self.contract_id = contract_id
         self.network = network
         self.rpc_url = self.RPC_URLS[network]
+        self.count_ttl = count_ttl
+        self._count_cache: Optional[Tuple[float, int]] = None
+        # Cleared the first time the endpoint rejects a JSON-RPC batch
+        self._rpc_batch = True
+        # Fixed view-call params per contract method; each call only adds
+        # its args (see _view_call)
+        self._view_params = {
+            method_name: MappingProxyType({
+                "request_type": "call_function",
+                "finality": "final",
+                "account_id": contract_id,
+                "method_name": method_name,
+            })
+            for method_name in ("verify", "get_attestation_count")
+        }
+
+        # Persistent pool: RPC calls reuse one TLS session instead of
+        # handshaking per call
+        self._rpc = httpx.Client(
+            base_url=self.rpc_url,
+            headers=self.RPC_HEADERS,
+            timeout=self.RPC_TIMEOUT,
+            http2=_HTTP2,
+            limits=self.RPC_LIMITS,
+        )
 
     @staticmethod
     def compute_hash(score_payload: Dict[str, Any]) -> str:
@@ -569,47 +2216,140 @@ class AttestationService:
         Returns:
             Hash string in format "sha256:<hex>"
         """
-        canonical = json.dumps(score_payload, sort_keys=True, separators=(",", ":"))
-        hash_hex = hashlib.sha256(canonical.encode()).hexdigest()
+        hash_hex = hashlib.sha256(_canonical_json(score_payload)).hexdigest()
         return f"sha256:{hash_hex}"
 
-    def verify(self, session_id: str) -> VerificationResult:
+    @staticmethod
+    async def compute_hash_async(score_payload: Dict[str, Any]) -> str:
         """
-        Verify an attestation exists on-chain for a given session.
+        compute_hash() on a worker thread, keeping the event loop free.
 
-        Makes a view call to the smart contract (no gas required).
+        Worth it for multi-KB payloads under concurrency; hashlib drops
+        the GIL while hashing large buffers.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            _HASH_POOL, AttestationService.compute_hash, score_payload
+        )
+
+    @staticmethod
+    def quantize_payload(score_payload: Dict[str, Any], full_scale: float = 1.0) -> Dict[str, Any]:
+        """
+        Copy a score payload with overall_score and dimensions in basis points.
+
+        Hashing the quantized payload gives a fully integer canonical
+        form. It is a different hash from the unquantized payload, so
+        attest and verify must agree on which form is used.
 
         Args:
-            session_id: The assessment session ID to verify
+            score_payload: Score payload dict
+            full_scale: Maximum score of the payload's scale (see quantize_score)
 
         Returns:
-            VerificationResult with attestation data if found
+            New payload dict; other fields are copied unchanged
         """
-        import base64
-
-        args = json.dumps({"session_id": session_id})
-        args_b64 = base64.b64encode(args.encode()).decode()
-
-        resp = httpx.post(
-            self.rpc_url,
-            json={
-                "jsonrpc": "2.0",
-                "id": "verify",
-                "method": "query",
-                "params": {
-                    "request_type": "call_function",
-                    "finality": "final",
-                    "account_id": self.contract_id,
-                    "method_name": "verify",
-                    "args_base64": args_b64,
-                },
+        quantized = dict(score_payload)
+        quantized["overall_score"] = quantize_score(score_payload["overall_score"], full_scale)
+        quantized["dimensions"] = {
+            name: quantize_score(value, full_scale)
+            for name, value in score_payload["dimensions"].items()
+        }
+        return quantized
+
+    @staticmethod
+    def _hash_score_payload_fast(
+        session_id: str,
+        overall_score: float,
+        tier: str,
+        dims: Tuple[float, float, float, float, float],
+        timestamp: int,
+    ) -> str:
+        """
+        compute_hash() for a score payload given as fields, not a dict.
+
+        Without orjson this formats the pre-sorted template directly, so
+        no dict is built, iterated or key-sorted. With orjson installed
+        its C encoder beats the template (float repr dominates), so the
+        dict is built and hashed via compute_hash(). The result is
+        identical either way.
+
+        Args:
+            session_id: Assessment session ID
+            overall_score: Overall score
+            tier: Tier label
+            dims: Dimension scores in PAICE order (Performance,
+                  Accountability, Integrity, Collaboration, Evolution)
+            timestamp: Integer timestamp
+
+        Returns:
+            Hash string in format "sha256:<hex>"
+        """
+        performance, accountability, integrity, collaboration, evolution = dims
+        if orjson is None:
+            canonical = _score_fields_canonical(
+                session_id,
+                overall_score,
+                tier,
+                (accountability, collaboration, evolution, integrity, performance),
+                timestamp,
+            )
+            if canonical is not None:
+                return f"sha256:{hashlib.sha256(canonical).hexdigest()}"
+
+        return AttestationService.compute_hash({
+            "session_id": session_id,
+            "overall_score": overall_score,
+            "tier": tier,
+            "dimensions": {
+                "Performance": performance,
+                "Accountability": accountability,
+                "Integrity": integrity,
+                "Collaboration": collaboration,
+                "Evolution": evolution,
             },
-        )
+            "timestamp": timestamp,
+        })
+
+    @staticmethod
+    def compute_hashes_bulk(score_payloads: List[Dict[str, Any]]) -> List[str]:
+        """
+        Compute compute_hash() for many payloads (e.g. verifier sweeps).
+
+        Each canonical encoding is handed straight to OpenSSL's SHA-256
+        (hardware-accelerated where available) with lookups hoisted out
+        of the loop; no intermediate str or buffer copies are made.
+
+        Args:
+            score_payloads: List of score payload dicts
+
+        Returns:
+            Hash strings in input order, each "sha256:<hex>"
+        """
+        sha256 = hashlib.sha256
+        canonical = _canonical_json
+        return [f"sha256:{sha256(canonical(p)).hexdigest()}" for p in score_payloads]
+
+    @staticmethod
+    def _verify_args(session_id: str) -> str:
+        """Base64 JSON arguments for the contract's verify view method."""
+        args = {"session_id": session_id}
+        raw = orjson.dumps(args) if orjson is not None else json.dumps(args).encode()
+        return base64.b64encode(raw).decode()
+
+    def _view_call(self, request_id: str, method_name: str, args_b64: str) -> Dict[str, Any]:
+        """Build the JSON-RPC body for a contract view call (args already base64)."""
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "query",
+            "params": {**self._view_params[method_name], "args_base64": args_b64},
+        }
 
-        data = resp.json()
+    @staticmethod
+    def _parse_verification(data: Dict[str, Any]) -> VerificationResult:
+        """Convert a verify() view call response to a VerificationResult."""
         if "result" in data and "result" in data["result"]:
-            raw = bytes(data["result"]["result"]).decode()
-            attestation = json.loads(raw)
+            raw = bytes(data["result"]["result"])
+            attestation = _json_loads(raw)
             if attestation:
                 return VerificationResult(
                     found=True,
@@ -620,42 +2360,163 @@ class AttestationService:
 
         return VerificationResult(found=False)
 
-    def get_attestation_count(self) -> int:
-        """Get the total number of attestations on the contract."""
-        import base64
-
-        args_b64 = base64.b64encode(b"{}").decode()
-
-        resp = httpx.post(
-            self.rpc_url,
-            json={
-                "jsonrpc": "2.0",
-                "id": "count",
-                "method": "query",
-                "params": {
-                    "request_type": "call_function",
-                    "finality": "final",
-                    "account_id": self.contract_id,
-                    "method_name": "get_attestation_count",
-                    "args_base64": args_b64,
-                },
-            },
+    def verify(self, session_id: str) -> VerificationResult:
+        """
+        Verify an attestation exists on-chain for a given session.
+
+        Makes a view call to the smart contract (no gas required).
+
+        Args:
+            session_id: The assessment session ID to verify
+
+        Returns:
+            VerificationResult with attestation data if found
+        """
+        resp = self._rpc.post(
+            "",
+            json=self._view_call("verify", "verify", self._verify_args(session_id)),
+        )
+        return self._parse_verification(_json_loads(resp.content))
+
+    async def averify_many(
+        self,
+        session_ids: List[str],
+        chunk_size: int = 50,
+    ) -> Dict[str, VerificationResult]:
+        """
+        Verify many sessions, chunk_size at a time.
+
+        Each chunk is sent as one JSON-RPC batch (an array of view calls).
+        If the endpoint rejects batches (a 400, or a reply that is not an
+        array answering every id, as public NEAR RPC nodes do), that is
+        remembered and the view calls are instead issued individually and
+        concurrently over one connection pool. Any other error status
+        (e.g. a transient 429/503) only sends that chunk as single calls.
+
+        Args:
+            session_ids: Assessment session IDs to verify
+            chunk_size: View calls per batch, or in flight at once
+
+        Returns:
+            Dict mapping each session ID to its VerificationResult
+        """
+        results: Dict[str, VerificationResult] = {}
+
+        async with httpx.AsyncClient(
+            base_url=self.rpc_url,
+            headers=self.RPC_HEADERS,
+            timeout=self.RPC_TIMEOUT,
+            http2=_HTTP2,
+            limits=self.RPC_LIMITS,
+        ) as client:
+            async def verify_one(session_id: str) -> VerificationResult:
+                resp = await client.post(
+                    "",
+                    json=self._view_call("verify", "verify", self._verify_args(session_id)),
+                )
+                return self._parse_verification(_json_loads(resp.content))
+
+            def batch_rejected() -> None:
+                logger.info("RPC endpoint rejected JSON-RPC batch; using single calls")
+                self._rpc_batch = False
+
+            async def verify_batch(chunk: List[str]) -> Optional[List[VerificationResult]]:
+                resp = await client.post(
+                    "",
+                    json=[
+                        self._view_call(str(n), "verify", self._verify_args(sid))
+                        for n, sid in enumerate(chunk)
+                    ],
+                )
+                if resp.is_error:
+                    if resp.status_code == 400:
+                        batch_rejected()
+                    else:
+                        logger.warning(
+                            f"RPC batch got {resp.status_code}; sending this chunk as single calls"
+                        )
+                    return None
+                try:
+                    replies = _json_loads(resp.content)
+                except ValueError:
+                    replies = None
+                if not isinstance(replies, list):
+                    batch_rejected()
+                    return None
+                by_id = {reply.get("id"): reply for reply in replies if isinstance(reply, dict)}
+                if any(str(n) not in by_id for n in range(len(chunk))):
+                    batch_rejected()
+                    return None
+                return [self._parse_verification(by_id[str(n)]) for n in range(len(chunk))]
+
+            for i in range(0, len(session_ids), chunk_size):
+                chunk = session_ids[i:i + chunk_size]
+                verified = await verify_batch(chunk) if self._rpc_batch else None
+                if verified is None:
+                    verified = await asyncio.gather(*(verify_one(sid) for sid in chunk))
+                results.update(zip(chunk, verified))
+
+        return results
+
+    def verify_many(
+        self,
+        session_ids: List[str],
+        chunk_size: int = 50,
+    ) -> Dict[str, VerificationResult]:
+        """Synchronous wrapper around averify_many()."""
+        return asyncio.run(self.averify_many(session_ids, chunk_size))
+
+    def get_attestation_count(self, force_refresh: bool = False) -> int:
+        """
+        Get the total number of attestations on the contract.
+
+        Cached for count_ttl seconds when set; pass force_refresh=True
+        to always query the chain.
+        """
+        now = time.monotonic()
+        if not force_refresh and self._count_cache is not None:
+            fetched_at, count = self._count_cache
+            if now - fetched_at < self.count_ttl:
+                return count
+
+        resp = self._rpc.post(
+            "",
+            json=self._view_call("count", "get_attestation_count", self._EMPTY_ARGS_B64),
         )
 
-        data = resp.json()
+        data = _json_loads(resp.content)
         if "result" in data and "result" in data["result"]:
             raw = bytes(data["result"]["result"]).decode()
-            return int(raw)
+            count = int(raw)
+            self._count_cache = (now, count)
+            return count
 
         return 0
 
-    def get_explorer_url(self, tx_hash: Optional[str] = None) -> str:
-        """Get the block explorer URL for the contract or a transaction."""
-        base = (
+    @functools.cached_property
+    def _explorer_base(self) -> str:
+        return (
             "https://testnet.nearblocks.io"
             if self.network == "testnet"
             else "https://nearblocks.io"
         )
+
+    @functools.cached_property
+    def explorer_url(self) -> str:
+        """Block explorer URL for the contract (computed once)."""
+        return f"{self._explorer_base}/address/{self.contract_id}"
+
+    def get_explorer_url(self, tx_hash: Optional[str] = None) -> str:
+        """Get the block explorer URL for the contract or a transaction."""
         if tx_hash:
-            return f"{base}/txns/{tx_hash}"
-        return f"{base}/address/{self.contract_id}"
+            return f"{self._explorer_base}/txns/{tx_hash}"
+        return self.explorer_url
+
+    def close(self):
+        self._rpc.close()
+
+    def __enter__(self) -> "AttestationService":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()